@@ -1,10 +1,13 @@
 from dataclasses import dataclass
 import logging
+import sqlite3
 import threading
 import time
 import traceback
+from contextlib import closing
+from itertools import chain
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Collection, Dict, Iterable, List, Optional, Set, Tuple
 from concurrent.futures.thread import ThreadPoolExecutor
 
 from blspy import G1Element
@@ -16,13 +19,13 @@ from chia.plotting.util import (
     PlotRefreshResult,
     PlotsRefreshParameter,
     PlotRefreshEvents,
-    get_plot_filenames,
+    get_filenames,
+    get_plot_directories,
     parse_plot_info,
 )
 from chia.util.generator_tools import list_to_batches
 from chia.util.ints import uint16
 from chia.util.path import mkdir
-from chia.util.streamable import Streamable, streamable
 from chia.types.blockchain_format.proof_of_space import ProofOfSpace
 from chia.types.blockchain_format.sized_bytes import bytes32
 from chia.wallet.derive_keys import master_sk_to_local_sk
@@ -30,91 +33,182 @@ from chia.wallet.derive_chives_keys import master_sk_to_chives_local_sk
 
 log = logging.getLogger(__name__)
 
-CURRENT_VERSION: uint16 = uint16(0)
+CURRENT_VERSION: uint16 = uint16(1)
+DIRECTORY_MTIME_RESOLUTION_SECONDS: int = 2
 
 
 @dataclass(frozen=True)
-@streamable
-class CacheEntry(Streamable):
+class CacheEntry:
     pool_public_key: Optional[G1Element]
     pool_contract_puzzle_hash: Optional[bytes32]
     plot_public_key: G1Element
 
 
-@dataclass(frozen=True)
-@streamable
-class DiskCache(Streamable):
-    version: uint16
-    data: List[Tuple[bytes32, CacheEntry]]
+CacheRow = Tuple[bytes, Optional[bytes], Optional[bytes], bytes]
+
+
+def cache_entry_to_row(plot_id: bytes32, entry: CacheEntry) -> CacheRow:
+    # Store the raw key bytes in separate columns so that loading the cache is just a few `from_bytes` calls per entry
+    return (
+        plot_id,
+        None if entry.pool_public_key is None else bytes(entry.pool_public_key),
+        entry.pool_contract_puzzle_hash,
+        bytes(entry.plot_public_key),
+    )
+
+
+def cache_entry_from_row(row: CacheRow) -> CacheEntry:
+    _, pool_public_key, pool_contract_puzzle_hash, plot_public_key = row
+    return CacheEntry(
+        None if pool_public_key is None else G1Element.from_bytes(pool_public_key),
+        None if pool_contract_puzzle_hash is None else bytes32(pool_contract_puzzle_hash),
+        G1Element.from_bytes(plot_public_key),
+    )
 
 
 class Cache:
-    _changed: bool
     _data: Dict[bytes32, CacheEntry]
+    _rows: Dict[bytes32, CacheRow]
+    _updated: Set[bytes32]
+    _removed: Set[bytes32]
 
     def __init__(self, path: Path):
-        self._changed = False
         self._data = {}
+        # Rows loaded from disk which were not requested yet. They only get converted into a `CacheEntry` on first
+        # access because `G1Element.from_bytes` is expensive and entries of removed plots never need to be decoded.
+        self._rows = {}
+        self._updated = set()
+        self._removed = set()
         self._path = path
         if not path.parent.exists():
             mkdir(path.parent)
 
     def __len__(self):
-        return len(self._data)
+        return len(self._data) + len(self._rows)
 
     def update(self, plot_id: bytes32, entry: CacheEntry):
         self._data[plot_id] = entry
-        self._changed = True
+        self._rows.pop(plot_id, None)
+        self._updated.add(plot_id)
+        self._removed.discard(plot_id)
 
-    def remove(self, cache_keys: List[bytes32]):
+    def remove(self, cache_keys: Iterable[bytes32]):
         for key in cache_keys:
-            if key in self._data:
-                del self._data[key]
-                self._changed = True
+            if key in self._data or key in self._rows:
+                self._data.pop(key, None)
+                self._rows.pop(key, None)
+                self._updated.discard(key)
+                self._removed.add(key)
 
     def save(self):
         try:
-            disk_cache: DiskCache = DiskCache(
-                CURRENT_VERSION, [(plot_id, cache_entry) for plot_id, cache_entry in self.items()]
+            # Only write the entries which changed since the last save, unless the file needs to be created from scratch
+            updated: Iterable[CacheRow] = (
+                cache_entry_to_row(plot_id, self._data[plot_id]) for plot_id in self._updated
             )
-            serialized: bytes = bytes(disk_cache)
-            self._path.write_bytes(serialized)
-            self._changed = False
-            log.info(f"Saved {len(serialized)} bytes of cached data")
+            removed: Collection[bytes32] = self._removed
+            updated_count: int = len(self._updated)
+            if not self._path.exists():
+                updated = chain(
+                    (cache_entry_to_row(plot_id, entry) for plot_id, entry in self._data.items()), self._rows.values()
+                )
+                removed = []
+                updated_count = len(self)
+            with closing(sqlite3.connect(self._path)) as db:
+                with db:
+                    db.execute(f"PRAGMA user_version={CURRENT_VERSION}")
+                    db.execute(
+                        "CREATE TABLE IF NOT EXISTS plot_cache("
+                        "plot_id blob PRIMARY KEY, "
+                        "pool_public_key blob, "
+                        "pool_contract_puzzle_hash blob, "
+                        "plot_public_key blob)"
+                    )
+                    db.executemany("DELETE FROM plot_cache WHERE plot_id=?", ((plot_id,) for plot_id in removed))
+                    db.executemany("INSERT OR REPLACE INTO plot_cache VALUES(?, ?, ?, ?)", updated)
+            log.info(f"Saved cached data: updated {updated_count}, removed {len(removed)}")
+            self._updated.clear()
+            self._removed.clear()
+            # The streamable cache file of older versions is superseded by the database, so drop it
+            legacy_path: Path = self._path.parent / "plot_manager.dat"
+            if legacy_path.exists():
+                legacy_path.unlink()
         except Exception as e:
             log.error(f"Failed to save cache: {e}, {traceback.format_exc()}")
 
     def load(self):
-        try:
-            serialized = self._path.read_bytes()
-            log.info(f"Loaded {len(serialized)} bytes of cached data")
-            stored_cache: DiskCache = DiskCache.from_bytes(serialized)
-            if stored_cache.version != CURRENT_VERSION:
-                # TODO, Migrate or drop current cache if the version changes.
-                raise ValueError(f"Invalid cache version {stored_cache.version}. Expected version {CURRENT_VERSION}.")
-            self._data = {plot_id: cache_entry for plot_id, cache_entry in stored_cache.data}
-        except FileNotFoundError:
+        if not self._path.exists():
             log.debug(f"Cache {self._path} not found")
+            return
+        try:
+            with closing(sqlite3.connect(self._path)) as db:
+                version = db.execute("PRAGMA user_version").fetchone()[0]
+                if version != CURRENT_VERSION:
+                    # Outdated caches are dropped below and rebuilt from the plot files on the next refresh.
+                    raise ValueError(f"Invalid cache version {version}. Expected version {CURRENT_VERSION}.")
+                self._rows = {
+                    bytes32(row[0]): row
+                    for row in db.execute(
+                        "SELECT plot_id, pool_public_key, pool_contract_puzzle_hash, plot_public_key FROM plot_cache"
+                    )
+                }
+            self._data = {}
+            self._updated.clear()
+            self._removed.clear()
+            log.info(f"Loaded {len(self._rows)} cached entries")
+        except (sqlite3.DatabaseError, ValueError) as e:
+            log.error(f"Failed to load cache: {e}, {traceback.format_exc()}")
+            # Drop the invalid cache file, the next `save()` will write a new one from scratch.
+            try:
+                self._path.unlink()
+            except FileNotFoundError:
+                pass
         except Exception as e:
             log.error(f"Failed to load cache: {e}, {traceback.format_exc()}")
 
     def keys(self):
-        return self._data.keys()
+        return self._data.keys() | self._rows.keys()
 
     def items(self):
+        for plot_id in list(self._rows.keys()):
+            self.get(plot_id)
         return self._data.items()
 
     def get(self, plot_id):
-        return self._data.get(plot_id)
+        entry: Optional[CacheEntry] = self._data.get(plot_id)
+        if entry is None:
+            row: Optional[CacheRow] = self._rows.pop(plot_id, None)
+            if row is not None:
+                try:
+                    entry = cache_entry_from_row(row)
+                except Exception as e:
+                    # Drop the broken entry, the plot gets loaded from disk again and the row is replaced on save.
+                    log.error(f"Failed to decode cache entry for plot {plot_id.hex()}: {e}")
+                    self._removed.add(plot_id)
+                    return None
+                self._data[plot_id] = entry
+        return entry
 
     def changed(self):
-        return self._changed
+        return len(self._updated) > 0 or len(self._removed) > 0
 
     def path(self):
         return self._path
 
 
+def get_directory_mtimes(directories: Iterable[Path]) -> Dict[Path, int]:
+    mtimes: Dict[Path, int] = {}
+    for directory in directories:
+        try:
+            mtimes[directory] = directory.stat().st_mtime_ns
+        except OSError:
+            mtimes[directory] = -1
+    return mtimes
+
+
 class PlotManager:
+    # Only ever replaced as a whole (under `_lock`), never mutated in place. This allows readers to iterate over a
+    # snapshot `plots = plot_manager.plots` without acquiring the lock.
     plots: Dict[Path, PlotInfo]
     plot_filename_paths: Dict[str, Tuple[str, Set[str]]]
     plot_filename_paths_lock: threading.Lock
@@ -132,6 +226,8 @@ class PlotManager:
     _refresh_thread: Optional[threading.Thread]
     _refreshing_enabled: bool
     _refresh_callback: Callable
+    _last_directory_mtimes: Dict[Path, int]
+    _thread_pool: Optional[ThreadPoolExecutor]
 
     def __init__(
         self,
@@ -149,7 +245,7 @@ class PlotManager:
         self.no_key_filenames = set()
         self.farmer_public_keys = []
         self.pool_public_keys = []
-        self.cache = Cache(self.root_path.resolve() / "cache" / "plot_manager.dat")
+        self.cache = Cache(self.root_path.resolve() / "cache" / "plot_manager.sqlite")
         self.match_str = match_str
         self.open_no_key_filenames = open_no_key_filenames
         self.last_refresh_time = 0
@@ -159,6 +255,8 @@ class PlotManager:
         self._refresh_thread = None
         self._refreshing_enabled = False
         self._refresh_callback = refresh_callback  # type: ignore
+        self._thread_pool = None
+        self._last_directory_mtimes = {}
 
     def __enter__(self):
         self._lock.acquire()
@@ -169,10 +267,11 @@ class PlotManager:
     def reset(self):
         with self:
             self.last_refresh_time = time.time()
-            self.plots.clear()
+            self.plots = {}
             self.plot_filename_paths.clear()
             self.failed_to_open_filenames.clear()
             self.no_key_filenames.clear()
+            self._last_directory_mtimes.clear()
 
     def set_refresh_callback(self, callback: Callable):
         self._refresh_callback = callback  # type: ignore
@@ -180,13 +279,14 @@ class PlotManager:
     def set_public_keys(self, farmer_public_keys: List[G1Element], pool_public_keys: List[G1Element]):
         self.farmer_public_keys = farmer_public_keys
         self.pool_public_keys = pool_public_keys
+        # Plots might get loaded or dropped with the new keys, so make sure the next refresh doesn't get skipped
+        self._last_directory_mtimes = {}
 
     def public_keys_available(self):
         return len(self.farmer_public_keys) and len(self.pool_public_keys)
 
     def plot_count(self):
-        with self:
-            return len(self.plots)
+        return len(self.plots)
 
     def get_duplicates(self):
         result = []
@@ -202,7 +302,8 @@ class PlotManager:
     def start_refreshing(self):
         self._refreshing_enabled = True
         if self._refresh_thread is None or not self._refresh_thread.is_alive():
-            self.cache.load()
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(thread_name_prefix="plot_refresh")
             self._refresh_thread = threading.Thread(target=self._refresh_task)
             self._refresh_thread.start()
 
@@ -211,12 +312,20 @@ class PlotManager:
         if self._refresh_thread is not None and self._refresh_thread.is_alive():
             self._refresh_thread.join()
             self._refresh_thread = None
+        # Only shut the pool down once the refresh thread is gone, it's recreated by the next `start_refreshing`
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown()
+            self._thread_pool = None
 
     def trigger_refresh(self):
         log.debug("trigger_refresh")
+        # Explicitly triggered refreshes always process all files
+        self._last_directory_mtimes = {}
         self.last_refresh_time = 0
 
     def _refresh_task(self):
+        # Load the cache here instead of in `start_refreshing` to not block the caller with it
+        self.cache.load()
         while self._refreshing_enabled:
             try:
                 while not self.needs_refresh() and self._refreshing_enabled:
@@ -225,11 +334,29 @@ class PlotManager:
                 if not self._refreshing_enabled:
                     return
 
-                plot_filenames: Dict[Path, List[Path]] = get_plot_filenames(self.root_path)
-                plot_directories: Set[Path] = set(plot_filenames.keys())
+                refresh_start: float = time.time()
+                # Use a dict as ordered set to drop duplicated entries in the config
+                plot_directories: Dict[Path, None] = dict.fromkeys(
+                    Path(directory).resolve() for directory in get_plot_directories(self.root_path)
+                )
+                directory_mtimes: Dict[Path, int] = get_directory_mtimes(plot_directories)
+                if (
+                    self.refresh_parameter.skip_unchanged_directories
+                    and len(directory_mtimes) > 0
+                    and directory_mtimes == self._last_directory_mtimes
+                ):
+                    # Nothing was added to or removed from the plot directories since the last refresh which loaded
+                    # all the plots, so there is no need to list and process all the files again.
+                    self.log.debug("_refresh_task: plot directories unchanged, skip refresh")
+                    self._refresh_callback(PlotRefreshEvents.started, PlotRefreshResult())
+                    self._refresh_callback(PlotRefreshEvents.done, PlotRefreshResult())
+                    self.last_refresh_time = time.time()
+                    continue
+
                 plot_paths: List[Path] = []
-                for paths in plot_filenames.values():
-                    plot_paths += paths
+                for directory in plot_directories:
+                    plot_paths += get_filenames(directory)
+                plot_paths_set: Set[Path] = set(plot_paths)
 
                 total_result: PlotRefreshResult = PlotRefreshResult()
                 total_size = len(plot_paths)
@@ -237,41 +364,41 @@ class PlotManager:
                 self._refresh_callback(PlotRefreshEvents.started, PlotRefreshResult(remaining=total_size))
 
                 # First drop all plots we have in plot_filename_paths but not longer in the filesystem or set in config
-                for path in list(self.failed_to_open_filenames.keys()):
-                    if path not in plot_paths:
-                        del self.failed_to_open_filenames[path]
+                for path in self.failed_to_open_filenames.keys() - plot_paths_set:
+                    del self.failed_to_open_filenames[path]
 
-                for path in self.no_key_filenames.copy():
-                    if path not in plot_paths:
-                        self.no_key_filenames.remove(path)
+                self.no_key_filenames &= plot_paths_set
 
                 filenames_to_remove: List[str] = []
+                plots_to_remove: List[Path] = []
                 for plot_filename, paths_entry in self.plot_filename_paths.items():
                     loaded_path, duplicated_paths = paths_entry
-                    loaded_plot = Path(loaded_path) / Path(plot_filename)
-                    if loaded_plot not in plot_paths:
+                    loaded_plot = Path(loaded_path) / plot_filename
+                    if loaded_plot not in plot_paths_set:
                         filenames_to_remove.append(plot_filename)
-                        with self:
-                            if loaded_plot in self.plots:
-                                del self.plots[loaded_plot]
-                        total_result.removed.append(loaded_plot)
+                        plots_to_remove.append(loaded_plot)
                         # No need to check the duplicates here since we drop the whole entry
                         continue
 
                     paths_to_remove: List[str] = []
                     for path in duplicated_paths:
-                        loaded_plot = Path(path) / Path(plot_filename)
-                        if loaded_plot not in plot_paths:
+                        loaded_plot = Path(path) / plot_filename
+                        if loaded_plot not in plot_paths_set:
                             paths_to_remove.append(path)
                             total_result.removed.append(loaded_plot)
-                    for path in paths_to_remove:
-                        duplicated_paths.remove(path)
+                    duplicated_paths.difference_update(paths_to_remove)
 
                 for filename in filenames_to_remove:
                     del self.plot_filename_paths[filename]
 
+                if len(plots_to_remove) > 0:
+                    removed_plots: Set[Path] = set(plots_to_remove)
+                    with self:
+                        self.plots = {path: info for path, info in self.plots.items() if path not in removed_plots}
+                total_result.removed += plots_to_remove
+
                 for remaining, batch in list_to_batches(plot_paths, self.refresh_parameter.batch_size):
-                    batch_result: PlotRefreshResult = self.refresh_batch(batch, plot_directories)
+                    batch_result: PlotRefreshResult = self.refresh_batch(batch, set(plot_directories))
                     if not self._refreshing_enabled:
                         self.log.debug("refresh_plots: Aborted")
                         break
@@ -292,14 +419,28 @@ class PlotManager:
                     self._refresh_callback(PlotRefreshEvents.done, total_result)
 
                 # Cleanup unused cache
-                available_ids = set([plot_info.prover.get_id() for plot_info in self.plots.values()])
-                invalid_cache_keys = [plot_id for plot_id in self.cache.keys() if plot_id not in available_ids]
+                available_ids: Set[bytes32] = {plot_info.prover.get_id() for plot_info in self.plots.values()}
+                invalid_cache_keys: Set[bytes32] = self.cache.keys() - available_ids
                 self.cache.remove(invalid_cache_keys)
                 self.log.debug(f"_refresh_task: cached entries removed: {len(invalid_cache_keys)}")
 
                 if self.cache.changed():
                     self.cache.save()
 
+                # Only allow to skip the next refresh if all plots are loaded. Also ignore modification times which
+                # are too close to the start of this refresh, changes within the timestamp resolution of the file
+                # system could get missed otherwise.
+                all_plots_loaded = len(self.plots) + len(self.get_duplicates()) == total_size
+                mtime_threshold = int((refresh_start - DIRECTORY_MTIME_RESOLUTION_SECONDS) * 1e9)
+                if (
+                    self._refreshing_enabled
+                    and all_plots_loaded
+                    and all(mtime < mtime_threshold for mtime in directory_mtimes.values())
+                ):
+                    self._last_directory_mtimes = directory_mtimes
+                else:
+                    self._last_directory_mtimes = {}
+
                 self.last_refresh_time = time.time()
 
                 self.log.debug(
@@ -314,7 +455,6 @@ class PlotManager:
     def refresh_batch(self, plot_paths: List[Path], plot_directories: Set[Path]) -> PlotRefreshResult:
         start_time: float = time.time()
         result: PlotRefreshResult = PlotRefreshResult(processed=len(plot_paths))
-        counter_lock = threading.Lock()
 
         log.debug(f"refresh_batch: {len(plot_paths)} files in directories {plot_directories}")
 
@@ -335,37 +475,40 @@ class PlotManager:
                 # Try once every `refresh_parameter.retry_invalid_seconds` seconds to open the file
                 return None
 
-            if file_path in self.plots:
-                return self.plots[file_path]
-
-            entry: Optional[Tuple[str, Set[str]]] = self.plot_filename_paths.get(file_path.name)
+            plot_filename: str = file_path.name
+            plot_directory: str = str(file_path.parent)
+            entry: Optional[Tuple[str, Set[str]]] = self.plot_filename_paths.get(plot_filename)
             if entry is not None:
                 loaded_parent, duplicates = entry
-                if str(file_path.parent) in duplicates:
-                    log.debug(f"Skip duplicated plot {str(file_path)}")
+                if plot_directory in duplicates:
+                    log.debug(f"Skip duplicated plot {filename_str}")
                     return None
             try:
-                if not file_path.exists():
+                try:
+                    stat_info = file_path.stat()
+                except FileNotFoundError:
                     return None
 
-                prover = DiskProver(str(file_path))
+                prover = DiskProver(filename_str)
 
-                log.debug(f"process_file {str(file_path)}")
+                log.debug(f"process_file {filename_str}")
 
-                expected_size = _expected_plot_size(prover.get_size()) * UI_ACTUAL_SPACE_CONSTANT_FACTOR
-                stat_info = file_path.stat()
+                # Query the prover only once for values which are used multiple times below
+                plot_id: bytes32 = prover.get_id()
+                plot_size: int = prover.get_size()
+                expected_size = _expected_plot_size(plot_size) * UI_ACTUAL_SPACE_CONSTANT_FACTOR
 
                 # TODO: consider checking if the file was just written to (which would mean that the file is still
                 # being copied). A segfault might happen in this edge case.
 
-                if prover.get_size() >= 30 and stat_info.st_size < 0.98 * expected_size:
+                if plot_size >= 30 and stat_info.st_size < 0.98 * expected_size:
                     log.warning(
                         f"Not farming plot {file_path}. Size is {stat_info.st_size / (1024**3)} GiB, but expected"
                         f" at least: {expected_size / (1024 ** 3)} GiB. We assume the file is being copied."
                     )
                     return None
 
-                cache_entry = self.cache.get(prover.get_id())
+                cache_entry = self.cache.get(plot_id)
                 if cache_entry is None:
                     (
                         pool_public_key_or_puzzle_hash,
@@ -399,7 +542,7 @@ class PlotManager:
                     if file_path in self.no_key_filenames:
                         self.no_key_filenames.remove(file_path)
 
-                    if prover.get_size()<32:
+                    if plot_size < 32:
                         local_sk = master_sk_to_chives_local_sk(local_master_sk)
                     else:
                         local_sk = master_sk_to_local_sk(local_master_sk)
@@ -409,16 +552,18 @@ class PlotManager:
                     )
 
                     cache_entry = CacheEntry(pool_public_key, pool_contract_puzzle_hash, plot_public_key)
-                    self.cache.update(prover.get_id(), cache_entry)
+                    self.cache.update(plot_id, cache_entry)
 
                 with self.plot_filename_paths_lock:
-                    paths: Optional[Tuple[str, Set[str]]] = self.plot_filename_paths.get(file_path.name)
+                    paths: Optional[Tuple[str, Set[str]]] = self.plot_filename_paths.get(plot_filename)
                     if paths is None:
-                        paths = (str(Path(prover.get_filename()).parent), set())
-                        self.plot_filename_paths[file_path.name] = paths
+                        paths = (plot_directory, set())
+                        self.plot_filename_paths[plot_filename] = paths
                     else:
-                        paths[1].add(str(Path(prover.get_filename()).parent))
-                        log.warning(f"Have multiple copies of the plot {file_path.name} in {[paths[0], *paths[1]]}.")
+                        paths[1].add(plot_directory)
+                        log.warning(
+                            f"Have multiple copies of the plot {plot_filename} in {[paths[0], *sorted(paths[1])]}."
+                        )
                         return None
 
                 new_plot_info: PlotInfo = PlotInfo(
@@ -430,9 +575,6 @@ class PlotManager:
                     stat_info.st_mtime,
                 )
 
-                with counter_lock:
-                    result.loaded.append(new_plot_info)
-
                 if file_path in self.failed_to_open_filenames:
                     del self.failed_to_open_filenames[file_path]
 
@@ -441,15 +583,21 @@ class PlotManager:
                 log.error(f"Failed to open file {file_path}. {e} {tb}")
                 self.failed_to_open_filenames[file_path] = int(time.time())
                 return None
-            log.info(f"Found plot {file_path} of size {new_plot_info.prover.get_size()}")
+            log.info(f"Found plot {file_path} of size {plot_size}")
             return new_plot_info
 
-        with self, ThreadPoolExecutor() as executor:
-            plots_refreshed: Dict[Path, PlotInfo] = {}
-            for new_plot in executor.map(process_file, plot_paths):
-                if new_plot is not None:
-                    plots_refreshed[Path(new_plot.prover.get_filename())] = new_plot
-            self.plots.update(plots_refreshed)
+        # Only dispatch the files which are not loaded yet, there is nothing to do for the others. The results are
+        # collected here in one place rather than by the workers to avoid a lock roundtrip per plot.
+        new_paths: List[Path] = [path for path in plot_paths if path not in self.plots]
+        plots_refreshed: Dict[Path, PlotInfo] = {}
+        assert self._thread_pool is not None
+        for file_path, new_plot in zip(new_paths, self._thread_pool.map(process_file, new_paths)):
+            if new_plot is not None:
+                plots_refreshed[file_path] = new_plot
+                result.loaded.append(new_plot)
+        if len(plots_refreshed) > 0:
+            with self:
+                self.plots = {**self.plots, **plots_refreshed}
 
         result.duration = time.time() - start_time
 
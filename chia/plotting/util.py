@@ -1,4 +1,5 @@
 import logging
+import os
 
 from dataclasses import dataclass, field
 from enum import Enum
@@ -20,6 +21,7 @@ class PlotsRefreshParameter:
     retry_invalid_seconds: int = 1200
     batch_size: int = 300
     batch_sleep_milliseconds: int = 1
+    skip_unchanged_directories: bool = False
 
 
 @dataclass
@@ -122,13 +124,17 @@ def get_filenames(directory: Path) -> List[Path]:
         return []
     all_files: List[Path] = []
     try:
-        for child in directory.iterdir():
-            if not child.is_dir():
-                # If it is a file ending in .plot, add it - work around MacOS ._ files
-                if child.suffix == ".plot" and not child.name.startswith("._"):
-                    all_files.append(child)
-            else:
-                log.debug(f"Not checking subdirectory {child}, subdirectories not added by default")
+        # `os.scandir` provides the file type with the directory listing on most platforms, which saves a `stat` call
+        # per file compared to `Path.iterdir` + `Path.is_dir`.
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                child = Path(entry.path)
+                if not entry.is_dir():
+                    # If it is a file ending in .plot, add it - work around MacOS ._ files
+                    if child.suffix == ".plot" and not child.name.startswith("._"):
+                        all_files.append(child)
+                else:
+                    log.debug(f"Not checking subdirectory {child}, subdirectories not added by default")
     except Exception as e:
         log.warning(f"Error reading directory {directory} {e}")
     return all_files
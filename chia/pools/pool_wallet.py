@@ -638,7 +638,7 @@ class PoolWallet:
         if coins is None:
             raise ValueError("Not enough coins to create pool wallet")
 
-        launcher_parent: Coin = coins.copy().pop()
+        launcher_parent: Coin = next(iter(coins))
         genesis_launcher_puz: Program = SINGLETON_LAUNCHER
         launcher_coin: Coin = Coin(launcher_parent.name(), genesis_launcher_puz.get_tree_hash(), amount)
 
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, List
+from typing import Any, List, Optional
 
 from clvm.casts import int_to_bytes
 
@@ -28,7 +28,14 @@ class Coin(Streamable):
         # significant bit is set, to encode it as a positive number. This
         # despite "amount" being unsigned. This way, a CLVM program can generate
         # these hashes easily.
-        return std_hash(self.parent_coin_info + self.puzzle_hash + int_to_bytes(self.amount))
+
+        # Coins are immutable, so the hash only needs to be computed once per instance. The cache is stored in
+        # `__dict__` directly since the dataclass is frozen, it's not a field and doesn't affect equality or streaming.
+        coin_hash: Optional[bytes32] = self.__dict__.get("_cached_hash")
+        if coin_hash is None:
+            coin_hash = std_hash(self.parent_coin_info + self.puzzle_hash + int_to_bytes(self.amount))
+            self.__dict__["_cached_hash"] = coin_hash
+        return coin_hash
 
     def name(self) -> bytes32:
         return self.get_hash()
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional, Tuple
 
 from chia.types.blockchain_format.coin import Coin
 from chia.types.blockchain_format.program import SerializedProgram, INFINITE_COST
@@ -23,9 +23,20 @@ class CoinSpend(Streamable):
     # TODO: this function should be moved out of the full node. It cannot be
     # called on untrusted input
     def additions(self) -> List[Coin]:
-        return additions_for_solution(self.coin.name(), self.puzzle_reveal, self.solution, INFINITE_COST)
+        # The results only depend on the immutable fields, so they are cached in `__dict__` like `Coin.get_hash` does
+        additions: Optional[Tuple[Coin, ...]] = self.__dict__.get("_cached_additions")
+        if additions is None:
+            additions = tuple(
+                additions_for_solution(self.coin.name(), self.puzzle_reveal, self.solution, INFINITE_COST)
+            )
+            self.__dict__["_cached_additions"] = additions
+        return list(additions)
 
     # TODO: this function should be moved out of the full node. It cannot be
     # called on untrusted input
     def reserved_fee(self) -> int:
-        return fee_for_solution(self.puzzle_reveal, self.solution, INFINITE_COST)
+        reserved_fee: Optional[int] = self.__dict__.get("_cached_reserved_fee")
+        if reserved_fee is None:
+            reserved_fee = fee_for_solution(self.puzzle_reveal, self.solution, INFINITE_COST)
+            self.__dict__["_cached_reserved_fee"] = reserved_fee
+        return reserved_fee
@@ -2,12 +2,19 @@ import logging
 from pathlib import Path
 from typing import Dict
 
-import colorlog
 from concurrent_log_handler import ConcurrentRotatingFileHandler
 from logging.handlers import SysLogHandler
 
 from chia.util.path import mkdir, path_from_root
 
+try:
+    import colorlog
+
+    no_colorlog = False
+except ImportError:
+    # colorlog is only installed with the `console` extra
+    no_colorlog = True
+
 
 def initialize_logging(service_name: str, logging_config: Dict, root_path: Path):
     log_path = path_from_root(root_path, logging_config.get("log_filename", "log/debug.log"))
@@ -15,7 +22,17 @@ def initialize_logging(service_name: str, logging_config: Dict, root_path: Path)
 
     mkdir(str(log_path.parent))
     file_name_length = 33 - len(service_name)
-    if logging_config["log_stdout"]:
+    if logging_config["log_stdout"] and no_colorlog:
+        logger = logging.getLogger()
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(
+            logging.Formatter(
+                fmt=f"%(asctime)s.%(msecs)03d {service_name} %(name)-{file_name_length}s: %(levelname)-8s %(message)s",
+                datefmt=log_date_format,
+            )
+        )
+        logger.addHandler(stream_handler)
+    elif logging_config["log_stdout"]:
         handler = colorlog.StreamHandler()
         handler.setFormatter(
             colorlog.ColoredFormatter(
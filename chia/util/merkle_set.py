@@ -57,7 +57,9 @@ init_prehashed()
 def hashdown(mystr: bytes) -> bytes:
     assert len(mystr) == 66
     h = prehashed[bytes(mystr[0:1] + mystr[33:34])].copy()
-    h.update(mystr[1:33] + mystr[34:])
+    # Feed both hashes separately to not build another concatenated copy of them
+    h.update(mystr[1:33])
+    h.update(mystr[34:])
     return h.digest()[:32]
 
 
@@ -1,23 +1,32 @@
-from typing import KeysView, Generator
-
-SERVICES_FOR_GROUP = {
-    "all": "chia_harvester chia_timelord_launcher chia_timelord chia_farmer chia_full_node chia_wallet".split(),
-    "node": "chia_full_node".split(),
-    "harvester": "chia_harvester".split(),
-    "farmer": "chia_harvester chia_farmer chia_full_node chia_wallet".split(),
-    "farmer-no-wallet": "chia_harvester chia_farmer chia_full_node".split(),
-    "farmer-only": "chia_farmer".split(),
-    "timelord": "chia_timelord_launcher chia_timelord chia_full_node".split(),
-    "timelord-only": "chia_timelord".split(),
-    "timelord-launcher-only": "chia_timelord_launcher".split(),
-    "wallet": "chia_wallet".split(),
-    "introducer": "chia_introducer".split(),
-    "simulator": "chia_full_node_simulator".split(),
-    "crawler": "chia_crawler".split(),
-    "seeder": "chia_crawler chia_seeder".split(),
-    "seeder-only": "chia_seeder".split(),
+from typing import Dict, FrozenSet, KeysView, Generator, Tuple
+
+SERVICES_FOR_GROUP: Dict[str, Tuple[str, ...]] = {
+    "all": (
+        "chia_harvester",
+        "chia_timelord_launcher",
+        "chia_timelord",
+        "chia_farmer",
+        "chia_full_node",
+        "chia_wallet",
+    ),
+    "node": ("chia_full_node",),
+    "harvester": ("chia_harvester",),
+    "farmer": ("chia_harvester", "chia_farmer", "chia_full_node", "chia_wallet"),
+    "farmer-no-wallet": ("chia_harvester", "chia_farmer", "chia_full_node"),
+    "farmer-only": ("chia_farmer",),
+    "timelord": ("chia_timelord_launcher", "chia_timelord", "chia_full_node"),
+    "timelord-only": ("chia_timelord",),
+    "timelord-launcher-only": ("chia_timelord_launcher",),
+    "wallet": ("chia_wallet",),
+    "introducer": ("chia_introducer",),
+    "simulator": ("chia_full_node_simulator",),
+    "crawler": ("chia_crawler",),
+    "seeder": ("chia_crawler", "chia_seeder"),
+    "seeder-only": ("chia_seeder",),
 }
 
+_ALL_SERVICES: FrozenSet[str] = frozenset(service for services in SERVICES_FOR_GROUP.values() for service in services)
+
 
 def all_groups() -> KeysView[str]:
     return SERVICES_FOR_GROUP.keys()
@@ -30,4 +39,4 @@ def services_for_groups(groups) -> Generator[str, None, None]:
 
 
 def validate_service(service: str) -> bool:
-    return any(service in _ for _ in SERVICES_FOR_GROUP.values())
+    return service in _ALL_SERVICES
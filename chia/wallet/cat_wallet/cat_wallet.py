@@ -364,13 +364,14 @@ class CATWallet:
         else:
             # The parent is not a CAT which means we need to scrub all of its children from our DB
             child_coin_records = await self.wallet_state_manager.coin_store.get_coin_records_by_parent_id(coin_name)
-            if len(child_coin_records) > 0:
-                for record in child_coin_records:
-                    if record.wallet_id == self.id():
-                        await self.wallet_state_manager.coin_store.delete_coin_record(record.coin.name())
-                        await self.remove_lineage(record.coin.name())
-                        # We also need to make sure there's no record of the transaction
-                        await self.wallet_state_manager.tx_store.delete_transaction_record(record.coin.name())
+            names_to_remove: List[bytes32] = [
+                record.coin.name() for record in child_coin_records if record.wallet_id == self.id()
+            ]
+            if len(names_to_remove) > 0:
+                await self.wallet_state_manager.coin_store.delete_coin_records(names_to_remove)
+                await self.remove_lineages(names_to_remove)
+                # We also need to make sure there's no record of the transaction
+                await self.wallet_state_manager.tx_store.delete_transaction_records(names_to_remove)
 
     async def get_new_inner_hash(self) -> bytes32:
         puzzle = await self.get_new_inner_puzzle()
@@ -798,8 +799,12 @@ class CATWallet:
             await self.lineage_store.add_lineage_proof(name, lineage, in_transaction)
 
     async def remove_lineage(self, name: bytes32):
-        self.log.info(f"Removing parent {name} (probably had a non-CAT parent)")
-        await self.lineage_store.remove_lineage_proof(name)
+        await self.remove_lineages([name])
+
+    async def remove_lineages(self, names: List[bytes32]):
+        for name in names:
+            self.log.info(f"Removing parent {name} (probably had a non-CAT parent)")
+        await self.lineage_store.remove_lineage_proofs(names)
 
     async def save_info(self, cat_info: CATInfo, in_transaction):
         self.cat_info = cat_info
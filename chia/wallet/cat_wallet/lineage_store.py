@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import aiosqlite
 
@@ -63,12 +63,15 @@ class CATLineageStore:
                 self.db_wrapper.lock.release()
 
     async def remove_lineage_proof(self, coin_id: bytes32, in_transaction=True) -> None:
+        await self.remove_lineage_proofs([coin_id], in_transaction)
+
+    async def remove_lineage_proofs(self, coin_ids: List[bytes32], in_transaction=True) -> None:
         if not in_transaction:
             await self.db_wrapper.lock.acquire()
         try:
-            cursor = await self.db_connection.execute(
+            cursor = await self.db_connection.executemany(
                 f"DELETE FROM {self.table_name} WHERE coin_id=?;",
-                (coin_id.hex(),),
+                [(coin_id.hex(),) for coin_id in coin_ids],
             )
 
             await cursor.close()
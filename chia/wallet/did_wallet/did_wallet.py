@@ -13,6 +13,7 @@ from chia.types.blockchain_format.program import Program
 from chia.types.blockchain_format.sized_bytes import bytes32
 from chia.types.coin_spend import CoinSpend
 from chia.types.spend_bundle import SpendBundle
+from chia.util.byte_types import hexstr_to_bytes
 from chia.util.ints import uint64, uint32, uint8
 from chia.wallet.util.transaction_type import TransactionType
 
@@ -38,6 +39,8 @@ class DIDWallet:
     base_puzzle_program: Optional[bytes]
     base_inner_puzzle_hash: Optional[bytes32]
     wallet_id: int
+    # `did_info.parent_info` indexed by coin name, together with the `did_info` it was built for
+    _parent_info_index: Optional[Tuple[DIDInfo, Dict[bytes32, Optional[LineageProof]]]] = None
 
     @staticmethod
     async def create_new_did_wallet(
@@ -68,7 +71,7 @@ class DIDWallet:
         if num_of_backup_ids_needed > len(backups_ids):
             raise ValueError("Cannot require more IDs than are known.")
         self.did_info = DIDInfo(None, backups_ids, num_of_backup_ids_needed, [], None, None, None, None, False)
-        info_as_string = json.dumps(self.did_info.to_json_dict())
+        info_as_string = bytes(self.did_info).hex()
         self.wallet_info = await wallet_state_manager.user_store.create_wallet(
             "DID Wallet", WalletType.DISTRIBUTED_ID.value, info_as_string
         )
@@ -96,6 +99,9 @@ class DIDWallet:
             self.did_info.current_inner, self.did_info.origin_coin.name()
         ).get_tree_hash()
 
+        # Both records below share the same spend bundle, only compute its additions and removals once
+        additions: List[Coin] = spend_bundle.additions()
+        removals: List[Coin] = spend_bundle.removals()
         did_record = TransactionRecord(
             confirmed_at_height=uint32(0),
             created_at_time=uint64(int(time.time())),
@@ -105,8 +111,8 @@ class DIDWallet:
             confirmed=False,
             sent=uint32(10),
             spend_bundle=None,
-            additions=spend_bundle.additions(),
-            removals=spend_bundle.removals(),
+            additions=additions,
+            removals=removals,
             wallet_id=self.id(),
             sent_to=[],
             trade_id=None,
@@ -123,8 +129,8 @@ class DIDWallet:
             confirmed=False,
             sent=uint32(0),
             spend_bundle=spend_bundle,
-            additions=spend_bundle.additions(),
-            removals=spend_bundle.removals(),
+            additions=additions,
+            removals=removals,
             wallet_id=self.wallet_state_manager.main_wallet.id(),
             sent_to=[],
             trade_id=None,
@@ -150,7 +156,7 @@ class DIDWallet:
         self.log = logging.getLogger(name if name else __name__)
         self.wallet_state_manager = wallet_state_manager
         self.did_info = DIDInfo(None, [], uint64(0), [], None, None, None, None, False)
-        info_as_string = json.dumps(self.did_info.to_json_dict())
+        info_as_string = bytes(self.did_info).hex()
         self.wallet_info = await wallet_state_manager.user_store.create_wallet(
             "DID Wallet", WalletType.DISTRIBUTED_ID.value, info_as_string
         )
@@ -177,7 +183,11 @@ class DIDWallet:
         self.wallet_id = wallet_info.id
         self.standard_wallet = wallet
         self.wallet_info = wallet_info
-        self.did_info = DIDInfo.from_json_dict(json.loads(wallet_info.data))
+        try:
+            self.did_info = DIDInfo.from_bytes(hexstr_to_bytes(wallet_info.data))
+        except ValueError:
+            # Wallets which were stored before the switch to streamable bytes still have their info stored as JSON
+            self.did_info = DIDInfo.from_json_dict(json.loads(wallet_info.data))
         self.base_puzzle_program = None
         self.base_inner_puzzle_hash = None
         return self
@@ -278,11 +288,19 @@ class DIDWallet:
         inner_puzzle = await self.inner_puzzle_for_did_puzzle(coin.puzzle_hash)
         if self.did_info.temp_coin is not None:
             self.wallet_state_manager.state_changed("did_coin_added", self.wallet_info.id)
+
+        future_parent = LineageProof(
+            coin.parent_coin_info,
+            inner_puzzle.get_tree_hash(),
+            coin.amount,
+        )
+        self.log.info(f"Adding parent {coin.name()}: {future_parent}")
+        # Add the parent of the new coin with the same update to only serialize and store the wallet info once
         new_info = DIDInfo(
             self.did_info.origin_coin,
             self.did_info.backup_ids,
             self.did_info.num_of_backup_ids_needed,
-            self.did_info.parent_info,
+            [*self.did_info.parent_info, (coin.name(), future_parent)],
             inner_puzzle,
             None,
             None,
@@ -291,13 +309,6 @@ class DIDWallet:
         )
         await self.save_info(new_info, True)
 
-        future_parent = LineageProof(
-            coin.parent_coin_info,
-            inner_puzzle.get_tree_hash(),
-            coin.amount,
-        )
-
-        await self.add_parent(coin.name(), future_parent, True)
         parent = self.get_parent_for_coin(coin)
         if parent is None:
             parent_state: CoinState = (
@@ -494,9 +505,7 @@ class DIDWallet:
         private = master_sk_to_wallet_sk_unhardened(self.wallet_state_manager.private_key, index)
         signature = AugSchemeMPL.sign(private, message)
         # assert signature.validate([signature.PkMessagePair(pubkey, message)])
-        sigs = [signature]
-        aggsig = AugSchemeMPL.aggregate(sigs)
-        spend_bundle = SpendBundle(list_of_solutions, aggsig)
+        spend_bundle = SpendBundle(list_of_solutions, signature)
 
         did_record = TransactionRecord(
             confirmed_at_height=uint32(0),
@@ -563,9 +572,7 @@ class DIDWallet:
         private = master_sk_to_wallet_sk_unhardened(self.wallet_state_manager.private_key, index)
         signature = AugSchemeMPL.sign(private, message)
         # assert signature.validate([signature.PkMessagePair(pubkey, message)])
-        sigs = [signature]
-        aggsig = AugSchemeMPL.aggregate(sigs)
-        spend_bundle = SpendBundle(list_of_solutions, aggsig)
+        spend_bundle = SpendBundle(list_of_solutions, signature)
 
         did_record = TransactionRecord(
             confirmed_at_height=uint32(0),
@@ -630,9 +637,7 @@ class DIDWallet:
         private = master_sk_to_wallet_sk_unhardened(self.wallet_state_manager.private_key, index)
         signature = AugSchemeMPL.sign(private, message)
         # assert signature.validate([signature.PkMessagePair(pubkey, message)])
-        sigs = [signature]
-        aggsig = AugSchemeMPL.aggregate(sigs)
-        spend_bundle = SpendBundle(list_of_solutions, aggsig)
+        spend_bundle = SpendBundle(list_of_solutions, signature)
 
         did_record = TransactionRecord(
             confirmed_at_height=uint32(0),
@@ -669,8 +674,9 @@ class DIDWallet:
         innermessage = message.get_tree_hash()
         innerpuz: Program = self.did_info.current_inner
         # innerpuz solution is (mode, amount, message, new_inner_puzhash)
+        innerpuz_hash: bytes32 = innerpuz.get_tree_hash()
         messages = [(0, innermessage)]
-        innersol = Program.to([1, coin.amount, messages, innerpuz.get_tree_hash()])
+        innersol = Program.to([1, coin.amount, messages, innerpuz_hash])
 
         # full solution is (corehash parent_info my_amount innerpuz_reveal solution)
         full_puzzle: Program = did_wallet_puzzles.create_fullpuz(
@@ -695,7 +701,7 @@ class DIDWallet:
         message_spend = did_wallet_puzzles.create_spend_for_message(coin.name(), recovering_coin_name, newpuz, pubkey)
         message_spend_bundle = SpendBundle([message_spend], AugSchemeMPL.aggregate([]))
         # sign for AGG_SIG_ME
-        to_sign = Program.to([innerpuz.get_tree_hash(), coin.amount, messages]).get_tree_hash()
+        to_sign = Program.to([innerpuz_hash, coin.amount, messages]).get_tree_hash()
         message = to_sign + coin.name() + self.wallet_state_manager.constants.AGG_SIG_ME_ADDITIONAL_DATA
         pubkey = did_wallet_puzzles.get_pubkey_from_innerpuz(innerpuz)
         index = await self.wallet_state_manager.puzzle_store.index_for_pubkey(pubkey)
@@ -912,12 +918,13 @@ class DIDWallet:
         return inner_puzzle
 
     def get_parent_for_coin(self, coin) -> Optional[LineageProof]:
-        parent_info = None
-        for name, ccparent in self.did_info.parent_info:
-            if name == coin.parent_coin_info:
-                parent_info = ccparent
-
-        return parent_info
+        # `did_info` is only ever replaced as a whole, so rebuild the index whenever it's a different object. The last
+        # entry wins for duplicated names, like it did with a scan through the list.
+        index = self._parent_info_index
+        if index is None or index[0] is not self.did_info:
+            index = (self.did_info, dict(self.did_info.parent_info))
+            self._parent_info_index = index
+        return index[1].get(coin.parent_coin_info)
 
     async def generate_new_decentralised_id(self, amount: uint64) -> Optional[SpendBundle]:
         """
@@ -928,9 +935,10 @@ class DIDWallet:
         if coins is None:
             return None
 
-        origin = coins.copy().pop()
+        origin = next(iter(coins))
         genesis_launcher_puz = did_wallet_puzzles.SINGLETON_LAUNCHER
-        launcher_coin = Coin(origin.name(), genesis_launcher_puz.get_tree_hash(), amount)
+        genesis_launcher_puz_hash: bytes32 = genesis_launcher_puz.get_tree_hash()
+        launcher_coin = Coin(origin.name(), genesis_launcher_puz_hash, amount)
 
         did_inner: Program = await self.get_new_innerpuz()
         did_inner_hash = did_inner.get_tree_hash()
@@ -942,7 +950,7 @@ class DIDWallet:
         announcement_set.add(Announcement(launcher_coin.name(), announcement_message))
 
         tx_record: Optional[TransactionRecord] = await self.standard_wallet.generate_signed_transaction(
-            amount, genesis_launcher_puz.get_tree_hash(), uint64(0), origin.name(), coins, None, False, announcement_set
+            amount, genesis_launcher_puz_hash, uint64(0), origin.name(), coins, None, False, announcement_set
         )
 
         genesis_launcher_solution = Program.to([did_puzzle_hash, amount, bytes(0x80)])
@@ -985,8 +993,9 @@ class DIDWallet:
 
     async def generate_eve_spend(self, coin: Coin, full_puzzle: Program, innerpuz: Program):
         assert self.did_info.origin_coin is not None
+        innerpuz_hash: bytes32 = innerpuz.get_tree_hash()
         # innerpuz solution is (mode amount message new_puzhash)
-        innersol = Program.to([1, coin.amount, [], innerpuz.get_tree_hash()])
+        innersol = Program.to([1, coin.amount, [], innerpuz_hash])
         # full solution is (lineage_proof my_amount inner_solution)
         fullsol = Program.to(
             [
@@ -998,7 +1007,7 @@ class DIDWallet:
         list_of_solutions = [CoinSpend(coin, full_puzzle, fullsol)]
         # sign for AGG_SIG_ME
         message = (
-            Program.to([innerpuz.get_tree_hash(), coin.amount, []]).get_tree_hash()
+            Program.to([innerpuz_hash, coin.amount, []]).get_tree_hash()
             + coin.name()
             + self.wallet_state_manager.constants.AGG_SIG_ME_ADDITIONAL_DATA
         )
@@ -1007,9 +1016,7 @@ class DIDWallet:
         assert record is not None
         private = master_sk_to_wallet_sk_unhardened(self.wallet_state_manager.private_key, record.index)
         signature = AugSchemeMPL.sign(private, message)
-        sigs = [signature]
-        aggsig = AugSchemeMPL.aggregate(sigs)
-        spend_bundle = SpendBundle(list_of_solutions, aggsig)
+        spend_bundle = SpendBundle(list_of_solutions, signature)
         return spend_bundle
 
     async def get_frozen_amount(self) -> uint64:
@@ -1028,13 +1035,12 @@ class DIDWallet:
 
     async def add_parent(self, name: bytes32, parent: Optional[LineageProof], in_transaction: bool):
         self.log.info(f"Adding parent {name}: {parent}")
-        current_list = self.did_info.parent_info.copy()
-        current_list.append((name, parent))
         did_info: DIDInfo = DIDInfo(
             self.did_info.origin_coin,
             self.did_info.backup_ids,
             self.did_info.num_of_backup_ids_needed,
-            current_list,
+            # Build the new list in one go, the current one is still referenced by the current `did_info`
+            [*self.did_info.parent_info, (name, parent)],
             self.did_info.current_inner,
             self.did_info.temp_coin,
             self.did_info.temp_puzhash,
@@ -1064,7 +1070,7 @@ class DIDWallet:
     async def save_info(self, did_info: DIDInfo, in_transaction: bool):
         self.did_info = did_info
         current_info = self.wallet_info
-        data_str = json.dumps(did_info.to_json_dict())
+        data_str = bytes(did_info).hex()
         wallet_info = WalletInfo(current_info.id, current_info.name, current_info.type, data_str)
         self.wallet_info = wallet_info
         await self.wallet_state_manager.user_store.update_wallet(wallet_info, in_transaction)
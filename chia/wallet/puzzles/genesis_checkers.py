@@ -68,7 +68,7 @@ class GenesisById(LimitationsProgram):
     async def generate_issuance_bundle(cls, wallet, _: Dict, amount: uint64) -> Tuple[TransactionRecord, SpendBundle]:
         coins = await wallet.standard_wallet.select_coins(amount)
 
-        origin = coins.copy().pop()
+        origin = next(iter(coins))
         origin_id = origin.name()
 
         cat_inner: Program = await wallet.get_new_inner_puzzle()
@@ -163,7 +163,7 @@ class RLWallet:
         if coins is None:
             return False
 
-        origin = coins.copy().pop()
+        origin = next(iter(coins))
         origin_id = origin.name()
 
         user_pubkey_bytes = hexstr_to_bytes(user_pubkey)
@@ -130,14 +130,20 @@ class WalletCoinStore:
 
     # Sometimes we realize that a coin is actually not interesting to us so we need to delete it
     async def delete_coin_record(self, coin_name: bytes32) -> None:
-        if coin_name in self.coin_record_cache:
-            coin_record = self.coin_record_cache.pop(coin_name)
-            if coin_record.wallet_id in self.unspent_coin_wallet_cache:
-                coin_cache = self.unspent_coin_wallet_cache[coin_record.wallet_id]
-                if coin_name in coin_cache:
-                    coin_cache.pop(coin_record.coin.name())
+        await self.delete_coin_records([coin_name])
 
-        c = await self.db_connection.execute("DELETE FROM coin_record WHERE coin_name=?", (coin_name.hex(),))
+    async def delete_coin_records(self, coin_names: List[bytes32]) -> None:
+        for coin_name in coin_names:
+            if coin_name in self.coin_record_cache:
+                coin_record = self.coin_record_cache.pop(coin_name)
+                if coin_record.wallet_id in self.unspent_coin_wallet_cache:
+                    coin_cache = self.unspent_coin_wallet_cache[coin_record.wallet_id]
+                    if coin_name in coin_cache:
+                        coin_cache.pop(coin_record.coin.name())
+
+        c = await self.db_connection.executemany(
+            "DELETE FROM coin_record WHERE coin_name=?", [(coin_name.hex(),) for coin_name in coin_names]
+        )
         await c.close()
 
     # Update coin_record to be spent in DB
@@ -360,16 +360,33 @@ class WalletNode:
                     # state updates until we are sure that we subscribed to everything that we need to. Otherwise,
                     # we might not be able to process some state.
                     coin_ids: List[bytes32] = item.data
-                    for peer in self.server.get_full_node_connections():
-                        coin_states: List[CoinState] = await subscribe_to_coin_updates(coin_ids, peer, uint32(0))
+                    peers: List[WSChiaConnection] = self.server.get_full_node_connections()
+                    # Subscribe with all peers concurrently, the responses are then processed one peer at a time
+                    results = await asyncio.gather(
+                        *(subscribe_to_coin_updates(coin_ids, peer, uint32(0)) for peer in peers),
+                        return_exceptions=True,
+                    )
+                    for peer, coin_states in zip(peers, results):
+                        if isinstance(coin_states, BaseException):
+                            self.log.error(f"Failed to subscribe to coin ids with {peer.peer_host}: {coin_states}")
+                            await peer.close(9999)
+                            continue
                         if len(coin_states) > 0:
                             async with self.wallet_state_manager.lock:
                                 await self.receive_state_from_peer(coin_states, peer)
                 elif item.item_type == NewPeakQueueTypes.PUZZLE_HASH_SUBSCRIPTION:
                     puzzle_hashes: List[bytes32] = item.data
-                    for peer in self.server.get_full_node_connections():
-                        # Puzzle hash subscription
-                        coin_states: List[CoinState] = await subscribe_to_phs(puzzle_hashes, peer, uint32(0))
+                    peers = self.server.get_full_node_connections()
+                    # Puzzle hash subscription, same as above
+                    results = await asyncio.gather(
+                        *(subscribe_to_phs(puzzle_hashes, peer, uint32(0)) for peer in peers),
+                        return_exceptions=True,
+                    )
+                    for peer, coin_states in zip(peers, results):
+                        if isinstance(coin_states, BaseException):
+                            self.log.error(f"Failed to subscribe to puzzle hashes with {peer.peer_host}: {coin_states}")
+                            await peer.close(9999)
+                            continue
                         if len(coin_states) > 0:
                             async with self.wallet_state_manager.lock:
                                 await self.receive_state_from_peer(coin_states, peer)
@@ -1272,8 +1272,7 @@ class WalletStateManager:
 
     async def delete_trade_transactions(self, trade_id: bytes32):
         txs: List[TransactionRecord] = await self.tx_store.get_transactions_by_trade_id(trade_id)
-        for tx in txs:
-            await self.tx_store.delete_transaction_record(tx.name)
+        await self.tx_store.delete_transaction_records([tx.name for tx in txs])
 
     async def convert_puzzle_hash(self, wallet_id: uint32, puzzle_hash: bytes32) -> bytes32:
         wallet = self.wallets[wallet_id]
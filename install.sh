@@ -14,7 +14,7 @@ usage() {
 }
 
 PACMAN_AUTOMATED=
-EXTRAS=
+EXTRAS=console,
 
 while getopts adh flag
 do
@@ -14,7 +14,6 @@ dependencies = [
     "aiosqlite==0.17.0",  # asyncio wrapper for sqlite, to store blocks
     "bitstring==3.1.9",  # Binary data management library
     "colorama==0.4.4",  # Colorizes terminal output
-    "colorlog==5.0.1",  # Adds color to logs
     "concurrent-log-handler==0.9.19",  # Concurrently log and rotate logs
     "cryptography==3.4.7",  # Python cryptography library for TLS - keyring conflict
     "fasteners==0.16.3",  # For interprocess file locking, expected to be replaced by filelock
@@ -24,7 +23,6 @@ dependencies = [
     #  "keyrings.cryptfile==1.3.8",  # Secure storage for keys on Linux (Will be replaced)
     #  See https://github.com/frispete/keyrings.cryptfile/issues/15
     "PyYAML==5.4.1",  # Used for config file format
-    "setproctitle==1.2.2",  # Gives the chia processes readable names
     "sortedcontainers==2.4.0",  # For maintaining sorted mempools
     "websockets==8.1.0",  # For use in wallet RPC and electron UI
     # TODO: when moving to click 8 remove the pinning of black noted below
@@ -37,6 +35,12 @@ dependencies = [
     "packaging==21.0",
 ]
 
+# Only improve the console output and process names, not needed for headless deployments
+console_dependencies = [
+    "colorlog==5.0.1",  # Adds color to logs
+    "setproctitle==1.2.2",  # Gives the chia processes readable names
+]
+
 upnp_dependencies = [
     "miniupnpc==2.2.2",  # Allows users to open ports on their router
 ]
@@ -78,6 +82,7 @@ kwargs = dict(
         uvloop=["uvloop"],
         dev=dev_dependencies,
         upnp=upnp_dependencies,
+        console=console_dependencies,
     ),
     packages=[
         "build_scripts",
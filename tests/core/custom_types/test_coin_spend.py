@@ -0,0 +1,32 @@
+from chia.types.blockchain_format.coin import Coin
+from chia.types.blockchain_format.program import Program, SerializedProgram
+from chia.types.blockchain_format.sized_bytes import bytes32
+from chia.types.coin_spend import CoinSpend
+from chia.types.condition_opcodes import ConditionOpcode
+from chia.util.ints import uint64
+
+
+class TestCoinSpend:
+    def test_additions_and_reserved_fee(self) -> None:
+        coin = Coin(bytes32(b"a" * 32), bytes32(b"b" * 32), uint64(1000))
+        puzzle_hash = bytes32(b"c" * 32)
+        solution = Program.to([[ConditionOpcode.CREATE_COIN, puzzle_hash, 600], [ConditionOpcode.RESERVE_FEE, 400]])
+        coin_spend = CoinSpend(
+            coin, SerializedProgram.from_program(Program.to(1)), SerializedProgram.from_program(solution)
+        )
+        expected_additions = [Coin(coin.name(), puzzle_hash, uint64(600))]
+
+        additions = coin_spend.additions()
+        assert additions == expected_additions
+        # Modifying the returned list must not affect the cached result
+        additions.clear()
+        additions_again = coin_spend.additions()
+        assert additions_again == expected_additions
+        assert additions_again is not coin_spend.additions()
+
+        assert coin_spend.reserved_fee() == 400
+        assert coin_spend.reserved_fee() == 400
+        # The cached results don't affect equality or serialization
+        coin_spend_copy = CoinSpend.from_bytes(bytes(coin_spend))
+        assert coin_spend_copy == coin_spend
+        assert bytes(coin_spend_copy) == bytes(coin_spend)
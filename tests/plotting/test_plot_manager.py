@@ -1,13 +1,15 @@
 import logging
+import sqlite3
 import time
-from os import unlink
+from contextlib import closing
+from os import unlink, utime
 from pathlib import Path
 from shutil import copy, move
 from typing import Callable, Iterator, List, Optional
 import pytest
 from blspy import G1Element
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from chia.plotting.util import (
     PlotInfo,
     PlotRefreshResult,
@@ -121,10 +123,14 @@ class PlotRefreshTester:
 
         self.expected_result_matched = True
 
-    async def run(self, expected_result: PlotRefreshResult):
+    async def run(self, expected_result: PlotRefreshResult, *, explicit_trigger: bool = True):
         self.expected_result = expected_result
         self.expected_result_matched = False
-        self.plot_manager.trigger_refresh()
+        if explicit_trigger:
+            self.plot_manager.trigger_refresh()
+        else:
+            # Act like the refresh interval passed
+            self.plot_manager.last_refresh_time = 0
         await time_out_assert(5, self.plot_manager.needs_refresh, value=False)
         assert self.expected_result_matched
 
@@ -446,10 +452,46 @@ async def test_keys_missing(test_environment: TestEnvironment) -> None:
     assert len(env.refresh_tester.plot_manager.no_key_filenames) == 0
 
 
+@pytest.mark.asyncio
+async def test_refresh_skipped_if_directories_unchanged(test_environment: TestEnvironment) -> None:
+    env: TestEnvironment = test_environment
+    plot_manager = env.refresh_tester.plot_manager
+    plot_manager.refresh_parameter = replace(plot_manager.refresh_parameter, skip_unchanged_directories=True)
+    expected_result = PlotRefreshResult()
+    # Move the modification time of the directory into the past, recent ones never allow to skip a refresh
+    modification_time = time.time() - 60
+    utime(env.dir_1.path, (modification_time, modification_time))
+    add_plot_directory(env.root_path, str(env.dir_1.path))
+    expected_result.loaded = env.dir_1.plot_info_list()  # type: ignore[assignment]
+    expected_result.removed = []
+    expected_result.processed = len(env.dir_1)
+    expected_result.remaining = 0
+    await env.refresh_tester.run(expected_result, explicit_trigger=False)
+    # Nothing changed, so the next periodic refresh shouldn't process any files
+    expected_result.loaded = []
+    expected_result.processed = 0
+    await env.refresh_tester.run(expected_result, explicit_trigger=False)
+    assert len(env.refresh_tester.plot_manager.plots) == len(env.dir_1)
+    # But an explicitly triggered refresh should
+    expected_result.processed = len(env.dir_1)
+    await env.refresh_tester.run(expected_result)
+    # Removing a plot changes the modification time of the directory which should lead to a full refresh again
+    drop_plot = env.dir_1.path_list()[0]
+    env.dir_1.drop(drop_plot)
+    drop_plot.unlink()
+    expected_result.removed = [drop_plot]
+    expected_result.processed = len(env.dir_1)
+    await env.refresh_tester.run(expected_result, explicit_trigger=False)
+    assert len(env.refresh_tester.plot_manager.plots) == len(env.dir_1)
+
+
 @pytest.mark.asyncio
 async def test_plot_info_caching(test_environment, bt):
     env: TestEnvironment = test_environment
     expected_result = PlotRefreshResult()
+    # The cache file of older versions should be removed once the new cache is written
+    legacy_cache_path = env.refresh_tester.plot_manager.cache.path().parent / "plot_manager.dat"
+    legacy_cache_path.write_bytes(b"legacy")
     add_plot_directory(env.root_path, str(env.dir_1.path))
     expected_result.loaded = env.dir_1.plot_info_list()
     expected_result.removed = []
@@ -457,6 +499,7 @@ async def test_plot_info_caching(test_environment, bt):
     expected_result.remaining = 0
     await env.refresh_tester.run(expected_result)
     assert env.refresh_tester.plot_manager.cache.path().exists()
+    assert not legacy_cache_path.exists()
     unlink(env.refresh_tester.plot_manager.cache.path())
     # Should not write the cache again on shutdown because it didn't change
     assert not env.refresh_tester.plot_manager.cache.path().exists()
@@ -490,9 +533,22 @@ async def test_plot_info_caching(test_environment, bt):
     assert plot_manager.failed_to_open_filenames == env.refresh_tester.plot_manager.failed_to_open_filenames
     assert plot_manager.no_key_filenames == env.refresh_tester.plot_manager.no_key_filenames
     plot_manager.stop_refreshing()
-    # Modify the content of the plot_manager.dat
+    # Corrupt a single entry, it should be dropped and the plot should be loaded from disk again
+    with closing(sqlite3.connect(plot_manager.cache.path())) as db:
+        with db:
+            db.execute("UPDATE plot_cache SET plot_public_key=? WHERE rowid=1", (b"\x01",))
+    refresh_tester = PlotRefreshTester(env.root_path)
+    plot_manager = refresh_tester.plot_manager
+    plot_manager.cache.load()
+    assert len(plot_manager.cache) == len(env.dir_1)
+    assert len([plot_id for plot_id in plot_manager.cache.keys() if plot_manager.cache.get(plot_id) is None]) == 1
+    plot_manager.set_public_keys(bt.plot_manager.farmer_public_keys, bt.plot_manager.pool_public_keys)
+    await refresh_tester.run(expected_result)
+    assert len(plot_manager.cache) == len(env.dir_1)
+    plot_manager.stop_refreshing()
+    # Modify the content of the plot_manager.sqlite
     with open(plot_manager.cache.path(), "r+b") as file:
-        file.write(b"\xff\xff")  # Sets Cache.version to 65535
+        file.write(b"\xff\xff")  # Corrupts the SQLite header
     # Make sure it just loads the plots normally if it fails to load the cache
     refresh_tester: PlotRefreshTester = PlotRefreshTester(env.root_path)
     plot_manager = refresh_tester.plot_manager
@@ -0,0 +1,62 @@
+import json
+from typing import Optional, cast
+
+import pytest
+
+from chia.types.blockchain_format.coin import Coin
+from chia.types.blockchain_format.program import Program
+from chia.types.blockchain_format.sized_bytes import bytes32
+from chia.util.byte_types import hexstr_to_bytes
+from chia.util.ints import uint8, uint32, uint64
+from chia.wallet.did_wallet.did_info import DIDInfo
+from chia.wallet.did_wallet.did_wallet import DIDWallet
+from chia.wallet.lineage_proof import LineageProof
+from chia.wallet.util.wallet_types import WalletType
+from chia.wallet.wallet import Wallet
+from chia.wallet.wallet_info import WalletInfo
+
+
+class FakeUserStore:
+    wallet_info: Optional[WalletInfo] = None
+
+    async def update_wallet(self, wallet_info: WalletInfo, in_transaction: bool) -> None:
+        self.wallet_info = wallet_info
+
+
+class FakeWalletStateManager:
+    def __init__(self) -> None:
+        self.user_store = FakeUserStore()
+
+
+DID_INFO = DIDInfo(
+    Coin(bytes32(b"a" * 32), bytes32(b"b" * 32), uint64(1)),
+    [bytes32(b"c" * 32)],
+    uint64(1),
+    [(bytes32(b"d" * 32), LineageProof(bytes32(b"e" * 32), bytes32(b"f" * 32), uint64(1)))],
+    Program.to(1),
+    None,
+    None,
+    None,
+    False,
+)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(bytes(DID_INFO).hex(), id="hex"),
+        pytest.param(json.dumps(DID_INFO.to_json_dict()), id="legacy_json"),
+    ],
+)
+async def test_did_info_storage(data: str) -> None:
+    wallet_state_manager = FakeWalletStateManager()
+    wallet_info = WalletInfo(uint32(2), "DID Wallet", uint8(WalletType.DISTRIBUTED_ID), data)
+    did_wallet = await DIDWallet.create(wallet_state_manager, cast(Wallet, None), wallet_info)
+    assert did_wallet.did_info == DID_INFO
+    # Saving the info again always stores it as hex encoded streamable bytes
+    await did_wallet.save_info(did_wallet.did_info, False)
+    saved_wallet_info = wallet_state_manager.user_store.wallet_info
+    assert saved_wallet_info is not None
+    assert saved_wallet_info.data == bytes(DID_INFO).hex()
+    assert DIDInfo.from_bytes(hexstr_to_bytes(saved_wallet_info.data)) == DID_INFO
@@ -5,7 +5,7 @@ from typing import List, Optional
 import pytest
 import pytest_asyncio
 from clvm.casts import int_to_bytes
-from colorlog import getLogger
+from logging import getLogger
 
 from chia.consensus.block_rewards import calculate_pool_reward, calculate_base_farmer_reward
 from chia.protocols import wallet_protocol, full_node_protocol
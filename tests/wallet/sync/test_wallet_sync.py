@@ -3,7 +3,7 @@ import asyncio
 
 import pytest
 import pytest_asyncio
-from colorlog import getLogger
+from logging import getLogger
 
 from chia.consensus.block_rewards import calculate_base_farmer_reward, calculate_pool_reward
 from chia.protocols import full_node_protocol